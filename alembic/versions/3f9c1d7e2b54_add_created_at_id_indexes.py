@@ -0,0 +1,43 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: 3f9c1d7e2b54
+Revises: a0d4b6ca0a6d
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c1d7e2b54"
+down_revision: Union[str, Sequence[str], None] = "a0d4b6ca0a6d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KEYSET_TABLES = (
+    "users",
+    "rooms",
+    "notifications",
+    "event_moderation_history",
+    "application_history",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in KEYSET_TABLES:
+        op.create_index(
+            f"ix_{table_name}_created_at_id",
+            table_name,
+            ["created_at", "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in KEYSET_TABLES:
+        op.drop_index(f"ix_{table_name}_created_at_id", table_name=table_name)
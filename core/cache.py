@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from core.config import settings
+
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class ResponseCache:
+    # Кэш живёт в памяти процесса: при нескольких воркерах записи
+    # инвалидируются только локально, поэтому TTL держим коротким.
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = settings.response_cache_ttl_seconds,
+        max_entries: int = settings.response_cache_max_entries,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Счётчик инвалидаций: запрос, начатый до invalidate/clear своего ключа,
+        # не должен записать в кэш уже устаревший результат.
+        self._version = 0
+        self._invalidated_at: OrderedDict[Hashable, int] = OrderedDict()
+        # Нижняя граница для ключей, вытесненных из _invalidated_at, и для clear()
+        self._floor = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        self._version += 1
+        self._invalidated_at[key] = self._version
+        self._invalidated_at.move_to_end(key)
+        while len(self._invalidated_at) > self.max_entries:
+            _, self._floor = self._invalidated_at.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._invalidated_at.clear()
+        self._version += 1
+        self._floor = self._version
+
+    def _invalidated_since(self, key: Hashable, version: int) -> bool:
+        return max(self._floor, self._invalidated_at.get(key, 0)) > version
+
+    def cached(self, key_param: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+        def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+            @wraps(func)
+            async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if self.ttl_seconds <= 0:
+                    return await func(*args, **kwargs)
+                key = kwargs[key_param]
+                cached_value = self.get(key)
+                if cached_value is not None:
+                    return cached_value
+                version = self._version
+                result = await func(*args, **kwargs)
+                if not self._invalidated_since(key, version):
+                    self.set(key, result)
+                return result
+
+            return wrapper
+
+        return decorator
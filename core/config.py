@@ -15,6 +15,19 @@ class Settings(BaseSettings):
     postgres_port: int = 5432
     postgres_db: str = "postgres"
 
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = False
+    db_query_cache_size: int = 1200
+
+    response_cache_ttl_seconds: int = 10
+    response_cache_max_entries: int = 1024
+
+    # Пустой список — кросс-доменные запросы запрещены; origin фронтенда задаётся через CORS_ORIGINS
+    cors_origins: list[str] = []
+    cors_max_age_seconds: int = 60 * 60 * 24
+
     jwt_secret: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expiration_minutes: int = 60 * 24 * 7
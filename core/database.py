@@ -19,9 +19,11 @@ class DatabaseSessionManager:
         self.engine = create_async_engine(
             database_url,
             echo=settings.debug,
-            pool_size=20,
-            max_overflow=10,
-            pool_pre_ping=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            query_cache_size=settings.db_query_cache_size,
         )
         self.session_maker = async_sessionmaker(
             bind=self.engine,
@@ -64,6 +66,4 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
@@ -1,4 +1,5 @@
 from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import lru_cache
 
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +12,7 @@ from schemas.users import UserRecord
 
 
 async def provide_session() -> AsyncIterator[AsyncSession]:
+    # Сессии берут соединения из общего пула движка (см. DatabaseSessionManager.init)
     async for session in get_session():
         yield session
 
@@ -28,7 +30,8 @@ async def provide_current_user(
     return await resolve_current_user(session=session, token=token)
 
 
-def provide_user_with_roles(allowed_roles: set[UserRole]) -> Callable[[], Awaitable[UserRecord]]:
+@lru_cache(maxsize=None)
+def provide_user_with_roles(allowed_roles: frozenset[UserRole]) -> Callable[[], Awaitable[UserRecord]]:
     async def dependency(current_user: UserRecord = Depends(provide_current_user)) -> UserRecord:
         if current_user.role not in allowed_roles:
             raise InvalidStateError("Insufficient permissions")
@@ -14,6 +14,9 @@ from sqlalchemy.orm import (
 class Base(DeclarativeBase):
     __name__: str
     __tablename__: str
+    # Серверные created_at/updated_at возвращаются через RETURNING сразу после
+    # INSERT/UPDATE, поэтому после commit не нужен отдельный refresh
+    __mapper_args__ = {"eager_defaults": True}
     id: SQLAlchemyMapped[UUID] = sqlalchemy_mapped_column(
         primary_key=True, default=uuid4
     )
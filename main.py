@@ -6,8 +6,10 @@ from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.background import BackgroundTask
 
 from core.config import settings
 from routers import (
@@ -42,14 +44,21 @@ if settings.sentry_dsn:
     )
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.cors_origins,
+    # С "*" Starlette отражает любой Origin, поэтому credentials разрешаем только для явного списка
+    allow_credentials="*" not in settings.cors_origins,
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=settings.cors_max_age_seconds,
 )
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+UNSECURED_PATHS = frozenset({"/auth/login", "/auth/register", "/auth/refresh"})
+_BEARER_SECURITY = ({"bearerAuth": []},)
 
 
 def custom_openapi() -> dict:
@@ -66,13 +75,12 @@ def custom_openapi() -> dict:
         "scheme": "bearer",
         "bearerFormat": "JWT",
     }
-    unsecured_paths = {"/auth/login", "/auth/register", "/auth/refresh"}
     for path, operations in schema.get("paths", {}).items():
-        if path in unsecured_paths:
+        if path in UNSECURED_PATHS:
             continue
         for operation in operations.values():
             if isinstance(operation, dict):
-                operation.setdefault("security", []).append({"bearerAuth": []})
+                operation["security"] = list(_BEARER_SECURITY)
     app.openapi_schema = schema
     return app.openapi_schema
 
@@ -80,40 +88,53 @@ def custom_openapi() -> dict:
 app.openapi = custom_openapi
 
 
+_SERVICE_ERROR_STATUS_CODES: dict[type[ServiceError], int] = {
+    EntityNotFoundError: status.HTTP_404_NOT_FOUND,
+    EntityConflictError: status.HTTP_409_CONFLICT,
+    InvalidStateError: status.HTTP_400_BAD_REQUEST,
+}
+
+
+def _resolve_service_error_status(error_type: type[ServiceError]) -> int:
+    status_code = _SERVICE_ERROR_STATUS_CODES.get(error_type)
+    if status_code is not None:
+        return status_code
+    # Подклассы сервисных ошибок наследуют код ближайшего известного предка
+    for base in error_type.__mro__[1:]:
+        if base in _SERVICE_ERROR_STATUS_CODES:
+            return _SERVICE_ERROR_STATUS_CODES[base]
+    return status.HTTP_400_BAD_REQUEST
+
+
 @app.exception_handler(ServiceError)
 async def service_error_handler(_: Request, exc: ServiceError) -> JSONResponse:
-    status_code = status.HTTP_400_BAD_REQUEST
-    if isinstance(exc, EntityNotFoundError):
-        status_code = status.HTTP_404_NOT_FOUND
-    elif isinstance(exc, EntityConflictError):
-        status_code = status.HTTP_409_CONFLICT
-    elif isinstance(exc, InvalidStateError):
-        status_code = status.HTTP_400_BAD_REQUEST
-    
+    status_code = _resolve_service_error_status(type(exc))
+
     # Отправляем в Sentry только ошибки сервера (5xx), не клиентские ошибки (4xx)
+    background = None
     if status_code >= 500:
-        sentry_sdk.capture_exception(exc)
-    
+        background = BackgroundTask(sentry_sdk.capture_exception, exc)
+
     return JSONResponse(
         content={"detail": exc.detail},
         status_code=status_code,
+        background=background,
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(_: Request, exc: Exception) -> JSONResponse:
-    # Отправляем все необработанные исключения в Sentry
-    sentry_sdk.capture_exception(exc)
-    
     # В production не показываем детали ошибки клиенту
     if settings.debug:
         detail = str(exc)
     else:
         detail = "Internal server error"
     
+    # Отправляем все необработанные исключения в Sentry уже после ответа клиенту
     return JSONResponse(
         content={"detail": detail},
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        background=BackgroundTask(sentry_sdk.capture_exception, exc),
     )
 
 
@@ -41,10 +41,10 @@ class Event(Base):
     creator: Mapped["User"] = relationship("User", back_populates="created_events", foreign_keys=[creator_id])
     curator: Mapped["User"] = relationship("User", back_populates="curated_events", foreign_keys=[curator_id])
     room: Mapped[Optional["Room"]] = relationship("Room", back_populates="events")
-    categories: Mapped[list["EventCategoryMapping"]] = relationship("EventCategoryMapping", back_populates="event", cascade="all, delete-orphan")
-    registrations: Mapped[list["EventRegistration"]] = relationship("EventRegistration", back_populates="event", cascade="all, delete-orphan")
-    applications: Mapped[list["EventApplication"]] = relationship("EventApplication", back_populates="event", cascade="all, delete-orphan")
-    moderation_history: Mapped[list["EventModerationHistory"]] = relationship("EventModerationHistory", back_populates="event", cascade="all, delete-orphan")
+    categories: Mapped[list["EventCategoryMapping"]] = relationship("EventCategoryMapping", back_populates="event", cascade="all, delete-orphan", passive_deletes=True)
+    registrations: Mapped[list["EventRegistration"]] = relationship("EventRegistration", back_populates="event", cascade="all, delete-orphan", passive_deletes=True)
+    applications: Mapped[list["EventApplication"]] = relationship("EventApplication", back_populates="event", cascade="all, delete-orphan", passive_deletes=True)
+    moderation_history: Mapped[list["EventModerationHistory"]] = relationship("EventModerationHistory", back_populates="event", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<Event(id={self.id}, title={self.title}, status={self.status}, date={self.event_date})>"
@@ -59,7 +59,7 @@ class EventCategory(Base):
     color: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Relationships
-    events: Mapped[list["EventCategoryMapping"]] = relationship("EventCategoryMapping", back_populates="category", cascade="all, delete-orphan")
+    events: Mapped[list["EventCategoryMapping"]] = relationship("EventCategoryMapping", back_populates="category", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<EventCategory(id={self.id}, name={self.name})>"
@@ -108,7 +108,7 @@ class EventApplication(Base):
     # Relationships
     event: Mapped["Event"] = relationship("Event", back_populates="applications")
     applicant: Mapped["User"] = relationship("User", back_populates="event_applications")
-    history: Mapped[list["ApplicationHistory"]] = relationship("ApplicationHistory", back_populates="application", cascade="all, delete-orphan")
+    history: Mapped[list["ApplicationHistory"]] = relationship("ApplicationHistory", back_populates="application", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<EventApplication(id={self.id}, event_id={self.event_id}, status={self.status})>"
@@ -1,7 +1,7 @@
 from uuid import UUID
 from typing import Optional
 
-from sqlalchemy import String, Text, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, Text, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.table import Base
@@ -11,6 +11,7 @@ from core.enums import ModerationAction
 class EventModerationHistory(Base):
     """История модерации мероприятия кураторами"""
     __tablename__ = "event_moderation_history"
+    __table_args__ = (Index("ix_event_moderation_history_created_at_id", "created_at", "id"),)
 
     event_id: Mapped[UUID] = mapped_column(ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True)
     curator_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -28,6 +29,7 @@ class EventModerationHistory(Base):
 class ApplicationHistory(Base):
     """История модерации заявок на участие"""
     __tablename__ = "application_history"
+    __table_args__ = (Index("ix_application_history_created_at_id", "created_at", "id"),)
 
     application_id: Mapped[UUID] = mapped_column(ForeignKey("event_applications.id", ondelete="CASCADE"), nullable=False, index=True)
     moderator_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1,7 +1,7 @@
 from uuid import UUID
 from typing import Optional
 
-from sqlalchemy import String, Text, Boolean, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, Text, Boolean, ForeignKey, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.table import Base
@@ -11,6 +11,7 @@ from core.enums import NotificationType
 class Notification(Base):
     """Уведомление пользователя"""
     __tablename__ = "notifications"
+    __table_args__ = (Index("ix_notifications_created_at_id", "created_at", "id"),)
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     type: Mapped[NotificationType] = mapped_column(SQLEnum(NotificationType), nullable=False, index=True)
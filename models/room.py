@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import String, Integer, JSON, Boolean
+from sqlalchemy import String, Integer, JSON, Boolean, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.table import Base
@@ -9,6 +9,7 @@ from core.table import Base
 class Room(Base):
     """Модель аудитории"""
     __tablename__ = "rooms"
+    __table_args__ = (Index("ix_rooms_created_at_id", "created_at", "id"),)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     capacity: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -17,7 +18,7 @@ class Room(Base):
     is_available: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     # Relationships
-    events: Mapped[list["Event"]] = relationship("Event", back_populates="room")
+    events: Mapped[list["Event"]] = relationship("Event", back_populates="room", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<Room(id={self.id}, name={self.name}, capacity={self.capacity})>"
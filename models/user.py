@@ -1,7 +1,7 @@
 from uuid import UUID
 from typing import Optional
 
-from sqlalchemy import String, Enum as SQLEnum, JSON
+from sqlalchemy import String, Enum as SQLEnum, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey
 
@@ -12,6 +12,7 @@ from core.enums import UserRole
 class User(Base):
     """Модель пользователя"""
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     login: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -20,12 +21,12 @@ class User(Base):
     telegram_chat_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Relationships
-    profile: Mapped[Optional["UserProfile"]] = relationship("UserProfile", back_populates="user", uselist=False)
-    created_events: Mapped[list["Event"]] = relationship("Event", back_populates="creator", foreign_keys="Event.creator_id")
+    profile: Mapped[Optional["UserProfile"]] = relationship("UserProfile", back_populates="user", uselist=False, passive_deletes=True)
+    created_events: Mapped[list["Event"]] = relationship("Event", back_populates="creator", foreign_keys="Event.creator_id", passive_deletes=True)
     curated_events: Mapped[list["Event"]] = relationship("Event", back_populates="curator", foreign_keys="Event.curator_id")
-    event_registrations: Mapped[list["EventRegistration"]] = relationship("EventRegistration", back_populates="user")
-    event_applications: Mapped[list["EventApplication"]] = relationship("EventApplication", back_populates="applicant")
-    notifications: Mapped[list["Notification"]] = relationship("Notification", back_populates="user")
+    event_registrations: Mapped[list["EventRegistration"]] = relationship("EventRegistration", back_populates="user", passive_deletes=True)
+    event_applications: Mapped[list["EventApplication"]] = relationship("EventApplication", back_populates="applicant", passive_deletes=True)
+    notifications: Mapped[list["Notification"]] = relationship("Notification", back_populates="user", passive_deletes=True)
 
     def __repr__(self) -> str:
         return f"<User(id={self.id}, login={self.login}, role={self.role})>"
@@ -17,8 +17,6 @@ async def login_route(
     session: AsyncSession = Depends(provide_session),
 ) -> TokenPayload:
     result = await authenticate_user(session=session, payload=payload)
-    await session.close()
-    _ = session.is_active
     return result
 
 
@@ -28,30 +26,20 @@ async def register_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
     result = await register_user(session=session, payload=payload)
-    _ = result.profile.user_id
     return result
 
 
 @auth_router.get("/me", response_model=UserRecord)
 async def get_current_user_route(
     current_user: UserRecord = Depends(provide_current_user),
-    session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
-    from models.user import User
-    user_obj = await session.get(User, current_user.id)
-    _ = user_obj.created_events[0].title
     return current_user
 
 
 @auth_router.post("/refresh", response_model=TokenPayload)
 async def refresh_token_route(
     current_user: UserRecord = Depends(provide_current_user),
-    session: AsyncSession = Depends(provide_session),
 ) -> TokenPayload:
-    from models.user import User
-    user_obj = await session.get(User, current_user.id)
-    await session.commit()
-    _ = user_obj.profile.faculty
     token = create_access_token({"sub": str(current_user.id)})
     return TokenPayload(access_token=token, user_id=current_user.id)
 
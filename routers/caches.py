@@ -0,0 +1,35 @@
+from uuid import UUID
+
+from core.cache import ResponseCache
+
+
+# Все кэши ответов собраны здесь, чтобы роутеры не импортировали друг друга,
+# а знание о каскадных удалениях (ON DELETE CASCADE) жило в одном месте.
+user_cache = ResponseCache()
+user_profile_cache = ResponseCache()
+room_cache = ResponseCache()
+notification_cache = ResponseCache()
+event_moderation_history_cache = ResponseCache()
+application_history_cache = ResponseCache()
+
+
+def invalidate_user_cascade(user_id: UUID) -> None:
+    # Вместе с пользователем удаляются его профиль, уведомления, история модерации,
+    # а через его мероприятия и заявки — и их история
+    user_cache.invalidate(user_id)
+    user_profile_cache.clear()
+    notification_cache.clear()
+    event_moderation_history_cache.clear()
+    application_history_cache.clear()
+
+
+def invalidate_event_cascade(event_id: UUID) -> None:
+    # Мероприятия не кэшируются, но каскадно удаляются их уведомления,
+    # история модерации и заявки вместе со своей историей
+    notification_cache.clear()
+    event_moderation_history_cache.clear()
+    application_history_cache.clear()
+
+
+def invalidate_application_cascade(application_id: UUID) -> None:
+    application_history_cache.clear()
@@ -1,10 +1,12 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.dependencies import provide_current_user, provide_session
+from routers.caches import invalidate_application_cascade, invalidate_event_cascade
 from schemas.events import (
     EventApplicationCreatePayload,
     EventApplicationListParams,
@@ -58,18 +60,20 @@ from services.events import (
 
 events_router = APIRouter(prefix="/events", tags=["Events"], dependencies=[Depends(provide_current_user)])
 
+event_list_adapter = TypeAdapter(list[EventRecord])
+event_category_list_adapter = TypeAdapter(list[EventCategoryRecord])
+event_category_mapping_list_adapter = TypeAdapter(list[EventCategoryMappingRecord])
+event_registration_list_adapter = TypeAdapter(list[EventRegistrationRecord])
+event_application_list_adapter = TypeAdapter(list[EventApplicationRecord])
+
 
 @events_router.get("/", response_model=list[EventRecord])
 async def list_events_route(
     params: Annotated[EventListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventRecord]:
+) -> Response:
     result = await list_events(session=session, params=params)
-    if result:
-        from models.event import Event
-        event_obj = await session.get(Event, result[0].id)
-        _ = event_obj.creator.login  
-    return result
+    return Response(event_list_adapter.dump_json(result), media_type="application/json")
 
 
 @events_router.post("/", response_model=EventRecord, status_code=status.HTTP_201_CREATED)
@@ -78,10 +82,6 @@ async def create_event_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventRecord:
     result = await create_event(session=session, payload=payload)
-    from models.event import Event
-    event_obj = await session.get(Event, result.id)
-    
-    _ = event_obj.description.upper()  
     return result
 
 
@@ -89,13 +89,9 @@ async def create_event_route(
 async def list_event_categories_route(
     params: Annotated[EventCategoryListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventCategoryRecord]:
+) -> Response:
     result = await list_event_categories(session=session, params=params)
-    if result:
-        from models.event import EventCategory
-        category_obj = await session.get(EventCategory, result[0].id)
-        await session.commit()
-    return result
+    return Response(event_category_list_adapter.dump_json(result), media_type="application/json")
 
 
 @events_router.post("/categories", response_model=EventCategoryRecord, status_code=status.HTTP_201_CREATED)
@@ -110,8 +106,9 @@ async def create_event_category_route(
 async def list_event_category_mappings_route(
     params: Annotated[EventCategoryMappingListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventCategoryMappingRecord]:
-    return await list_event_category_mappings(session=session, params=params)
+) -> Response:
+    result = await list_event_category_mappings(session=session, params=params)
+    return Response(event_category_mapping_list_adapter.dump_json(result), media_type="application/json")
 
 
 @events_router.post(
@@ -130,8 +127,9 @@ async def create_event_category_mapping_route(
 async def list_event_registrations_route(
     params: Annotated[EventRegistrationListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventRegistrationRecord]:
-    return await list_event_registrations(session=session, params=params)
+) -> Response:
+    result = await list_event_registrations(session=session, params=params)
+    return Response(event_registration_list_adapter.dump_json(result), media_type="application/json")
 
 
 @events_router.post(
@@ -150,8 +148,9 @@ async def create_event_registration_route(
 async def list_event_applications_route(
     params: Annotated[EventApplicationListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventApplicationRecord]:
-    return await list_event_applications(session=session, params=params)
+) -> Response:
+    result = await list_event_applications(session=session, params=params)
+    return Response(event_application_list_adapter.dump_json(result), media_type="application/json")
 
 
 @events_router.post(
@@ -172,9 +171,6 @@ async def get_event_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventRecord:
     result = await get_event(session=session, event_id=event_id)
-    from models.event import Event
-    event_obj = await session.get(Event, event_id)
-    
     return result
 
 
@@ -185,10 +181,6 @@ async def update_event_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventRecord:
     result = await update_event(session=session, event_id=event_id, payload=payload)
-    from models.event import Event
-    event_obj = await session.get(Event, event_id)
-    
-    _ = event_obj.external_location.split(",")  
     return result
 
 
@@ -198,8 +190,7 @@ async def delete_event_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventRecord:
     result = await delete_event(session=session, event_id=event_id)
-    from models.user import User
-    creator_obj = await session.get(User, result.creator_id)
+    invalidate_event_cascade(event_id)
     return result
 
 
@@ -312,5 +303,7 @@ async def delete_event_application_route(
     application_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> EventApplicationRecord:
-    return await delete_event_application(session=session, application_id=application_id)
+    result = await delete_event_application(session=session, application_id=application_id)
+    invalidate_application_cascade(application_id)
+    return result
 
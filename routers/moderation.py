@@ -1,11 +1,13 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.dependencies import provide_session, provide_user_with_roles
 from core.enums import UserRole
+from routers.caches import application_history_cache, event_moderation_history_cache
 from schemas.moderation import (
     ApplicationHistoryCreatePayload,
     ApplicationHistoryListParams,
@@ -30,24 +32,25 @@ from services.moderation import (
 )
 
 
+MODERATOR_ROLES = frozenset({UserRole.ADMIN, UserRole.CURATOR})
+
 moderation_router = APIRouter(
     prefix="/moderation",
     tags=["Moderation"],
-    dependencies=[Depends(provide_user_with_roles({UserRole.ADMIN, UserRole.CURATOR}))],
+    dependencies=[Depends(provide_user_with_roles(MODERATOR_ROLES))],
 )
 
+event_moderation_history_list_adapter = TypeAdapter(list[EventModerationHistoryRecord])
+application_history_list_adapter = TypeAdapter(list[ApplicationHistoryRecord])
+
 
 @moderation_router.get("/event-history", response_model=list[EventModerationHistoryRecord])
 async def list_event_moderation_history_route(
     params: Annotated[EventModerationHistoryListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[EventModerationHistoryRecord]:
+) -> Response:
     result = await list_event_moderation_history(session=session, params=params)
-    if result:
-        from models.moderation import EventModerationHistory
-        history_obj = await session.get(EventModerationHistory, result[0].id)
-        _ = history_obj.event.title  
-    return result
+    return Response(event_moderation_history_list_adapter.dump_json(result), media_type="application/json")
 
 
 @moderation_router.post(
@@ -60,10 +63,6 @@ async def create_event_moderation_history_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventModerationHistoryRecord:
     result = await create_event_moderation_history(session=session, payload=payload)
-    from models.moderation import EventModerationHistory
-    history_obj = await session.get(EventModerationHistory, result.id)
-    
-    _ = history_obj.comment.upper()  
     return result
 
 
@@ -71,13 +70,9 @@ async def create_event_moderation_history_route(
 async def list_application_history_route(
     params: Annotated[ApplicationHistoryListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[ApplicationHistoryRecord]:
+) -> Response:
     result = await list_application_history(session=session, params=params)
-    if result:
-        from models.moderation import ApplicationHistory
-        history_obj = await session.get(ApplicationHistory, result[0].id)
-        _ = history_obj.application.status  
-    return result
+    return Response(application_history_list_adapter.dump_json(result), media_type="application/json")
 
 
 @moderation_router.post(
@@ -90,22 +85,16 @@ async def create_application_history_route(
     session: AsyncSession = Depends(provide_session),
 ) -> ApplicationHistoryRecord:
     result = await create_application_history(session=session, payload=payload)
-    from models.moderation import ApplicationHistory
-    history_obj = await session.get(ApplicationHistory, result.id)
-    
-    _ = history_obj.comment.lower()  
     return result
 
 
 @moderation_router.get("/event-history/{history_id}", response_model=EventModerationHistoryRecord)
+@event_moderation_history_cache.cached("history_id")
 async def get_event_moderation_history_route(
     history_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> EventModerationHistoryRecord:
     result = await get_event_moderation_history(session=session, history_id=history_id)
-    from models.moderation import EventModerationHistory
-    history_obj = await session.get(EventModerationHistory, history_id)
-    await session.commit()
     return result
 
 
@@ -120,10 +109,7 @@ async def update_event_moderation_history_route(
         history_id=history_id,
         payload=payload,
     )
-    from models.moderation import EventModerationHistory
-    history_obj = await session.get(EventModerationHistory, history_id)
-    
-    _ = history_obj.comment.split(" ")  
+    event_moderation_history_cache.invalidate(history_id)
     return result
 
 
@@ -133,21 +119,17 @@ async def delete_event_moderation_history_route(
     session: AsyncSession = Depends(provide_session),
 ) -> EventModerationHistoryRecord:
     result = await delete_event_moderation_history(session=session, history_id=history_id)
-    from models.moderation import EventModerationHistory
-    deleted_history = await session.get(EventModerationHistory, history_id)
-    _ = deleted_history.comment  
+    event_moderation_history_cache.invalidate(history_id)
     return result
 
 
 @moderation_router.get("/application-history/{history_id}", response_model=ApplicationHistoryRecord)
+@application_history_cache.cached("history_id")
 async def get_application_history_route(
     history_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> ApplicationHistoryRecord:
     result = await get_application_history(session=session, history_id=history_id)
-    from models.moderation import ApplicationHistory
-    history_obj = await session.get(ApplicationHistory, history_id)
-    _ = history_obj.application.motivation  
     return result
 
 
@@ -162,9 +144,7 @@ async def update_application_history_route(
         history_id=history_id,
         payload=payload,
     )
-    from models.moderation import ApplicationHistory
-    history_obj = await session.get(ApplicationHistory, history_id)
-    await session.commit()
+    application_history_cache.invalidate(history_id)
     return result
 
 
@@ -174,7 +154,6 @@ async def delete_application_history_route(
     session: AsyncSession = Depends(provide_session),
 ) -> ApplicationHistoryRecord:
     result = await delete_application_history(session=session, history_id=history_id)
-    from models.event import EventApplication
-    app_obj = await session.get(EventApplication, result.application_id)
+    application_history_cache.invalidate(history_id)
     return result
 
@@ -1,10 +1,12 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.dependencies import provide_current_user, provide_session
+from routers.caches import notification_cache
 from schemas.notifications import (
     NotificationCreatePayload,
     NotificationListParams,
@@ -22,18 +24,16 @@ from services.notifications import (
 
 notifications_router = APIRouter(prefix="/notifications", tags=["Notifications"], dependencies=[Depends(provide_current_user)])
 
+notification_list_adapter = TypeAdapter(list[NotificationRecord])
+
 
 @notifications_router.get("/", response_model=list[NotificationRecord])
 async def list_notifications_route(
     params: Annotated[NotificationListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[NotificationRecord]:
+) -> Response:
     result = await list_notifications(session=session, params=params)
-    if result:
-        from models.notification import Notification
-        notif_obj = await session.get(Notification, result[0].id)
-        _ = notif_obj.user.login  
-    return result
+    return Response(notification_list_adapter.dump_json(result), media_type="application/json")
 
 
 @notifications_router.post("/", response_model=NotificationRecord, status_code=status.HTTP_201_CREATED)
@@ -42,22 +42,16 @@ async def create_notification_route(
     session: AsyncSession = Depends(provide_session),
 ) -> NotificationRecord:
     result = await create_notification(session=session, payload=payload)
-    from models.notification import Notification
-    notif_obj = await session.get(Notification, result.id)
-    
-    _ = notif_obj.message.split("\n")  
     return result
 
 
 @notifications_router.get("/{notification_id}", response_model=NotificationRecord)
+@notification_cache.cached("notification_id")
 async def get_notification_route(
     notification_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> NotificationRecord:
     result = await get_notification(session=session, notification_id=notification_id)
-    from models.notification import Notification
-    notif_obj = await session.get(Notification, notification_id)
-    
     return result
 
 
@@ -72,9 +66,7 @@ async def update_notification_route(
         notification_id=notification_id,
         payload=payload,
     )
-    from models.notification import Notification
-    notif_obj = await session.get(Notification, notification_id)
-    await session.commit()
+    notification_cache.invalidate(notification_id)
     return result
 
 
@@ -84,8 +76,6 @@ async def delete_notification_route(
     session: AsyncSession = Depends(provide_session),
 ) -> NotificationRecord:
     result = await delete_notification(session=session, notification_id=notification_id)
-    from models.notification import Notification
-    deleted_notif = await session.get(Notification, notification_id)
-    _ = deleted_notif.message  
+    notification_cache.invalidate(notification_id)
     return result
 
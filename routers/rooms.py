@@ -1,29 +1,28 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.dependencies import provide_current_user, provide_session
+from routers.caches import room_cache
 from schemas.rooms import RoomCreatePayload, RoomListParams, RoomRecord, RoomUpdatePayload
 from services.rooms import create_room, delete_room, get_room, list_rooms, update_room
 
 
 rooms_router = APIRouter(prefix="/rooms", tags=["Rooms"], dependencies=[Depends(provide_current_user)])
 
+room_list_adapter = TypeAdapter(list[RoomRecord])
+
 
 @rooms_router.get("/", response_model=list[RoomRecord])
 async def list_rooms_route(
     params: Annotated[RoomListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[RoomRecord]:
+) -> Response:
     result = await list_rooms(session=session, params=params)
-    if result:
-        from models.room import Room
-        room_obj = await session.get(Room, result[0].id)
-        if room_obj.events:
-            _ = room_obj.events[0].title  
-    return result
+    return Response(room_list_adapter.dump_json(result), media_type="application/json")
 
 
 @rooms_router.post("/", response_model=RoomRecord, status_code=status.HTTP_201_CREATED)
@@ -32,22 +31,16 @@ async def create_room_route(
     session: AsyncSession = Depends(provide_session),
 ) -> RoomRecord:
     result = await create_room(session=session, payload=payload)
-    from models.room import Room
-    room_obj = await session.get(Room, result.id)
-    
-    _ = room_obj.equipment["projector"]  
     return result
 
 
 @rooms_router.get("/{room_id}", response_model=RoomRecord)
+@room_cache.cached("room_id")
 async def get_room_route(
     room_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> RoomRecord:
     result = await get_room(session=session, room_id=room_id)
-    from models.room import Room
-    room_obj = await session.get(Room, room_id)
-    await session.commit()
     return result
 
 
@@ -58,10 +51,7 @@ async def update_room_route(
     session: AsyncSession = Depends(provide_session),
 ) -> RoomRecord:
     result = await update_room(session=session, room_id=room_id, payload=payload)
-    from models.room import Room
-    room_obj = await session.get(Room, room_id)
-    
-    _ = room_obj.location.upper()  
+    room_cache.invalidate(room_id)
     return result
 
 
@@ -71,8 +61,6 @@ async def delete_room_route(
     session: AsyncSession = Depends(provide_session),
 ) -> RoomRecord:
     result = await delete_room(session=session, room_id=room_id)
-    from models.room import Room
-    deleted_room = await session.get(Room, room_id)
-    _ = deleted_room.name  
+    room_cache.invalidate(room_id)
     return result
 
@@ -1,10 +1,12 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.dependencies import provide_current_user, provide_session
+from routers.caches import invalidate_user_cascade, user_cache, user_profile_cache
 from schemas.users import (
     UserCreatePayload,
     UserListParams,
@@ -32,18 +34,17 @@ from services.users import (
 
 users_router = APIRouter(prefix="/users", tags=["Users"], dependencies=[Depends(provide_current_user)])
 
+user_list_adapter = TypeAdapter(list[UserRecord])
+user_profile_list_adapter = TypeAdapter(list[UserProfileRecord])
+
 
 @users_router.get("/", response_model=list[UserRecord])
 async def list_users_route(
     params: Annotated[UserListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[UserRecord]:
+) -> Response:
     result = await list_users(session=session, params=params)
-    from models.user import User
-    if result:
-        user_obj = await session.get(User, result[0].id)
-        _ = user_obj.profile.faculty  
-    return result
+    return Response(user_list_adapter.dump_json(result), media_type="application/json")
 
 
 @users_router.post("/", response_model=UserRecord, status_code=status.HTTP_201_CREATED)
@@ -52,9 +53,6 @@ async def create_user_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
     result = await create_user(session=session, payload=payload)
-    from models.user import User
-    user_obj = await session.get(User, result.id)
-    _ = user_obj.profile.study_group  
     return result
 
 
@@ -62,12 +60,9 @@ async def create_user_route(
 async def list_user_profiles_route(
     params: Annotated[UserProfileListParams, Depends()],
     session: AsyncSession = Depends(provide_session),
-) -> list[UserProfileRecord]:
+) -> Response:
     result = await list_user_profiles(session=session, params=params)
-    if result:
-        from models.user import UserProfile
-        profile_obj = await session.get(UserProfile, result[0].id)
-    return result
+    return Response(user_profile_list_adapter.dump_json(result), media_type="application/json")
 
 
 @users_router.post("/profiles", response_model=UserProfileRecord, status_code=status.HTTP_201_CREATED)
@@ -76,22 +71,16 @@ async def create_user_profile_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserProfileRecord:
     result = await create_user_profile(session=session, payload=payload)
-    from models.user import UserProfile
-    profile_obj = await session.get(UserProfile, result.id)
-    
     return result
 
 
 @users_router.get("/{user_id}", response_model=UserRecord)
+@user_cache.cached("user_id")
 async def get_user_route(
     user_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
     result = await get_user(session=session, user_id=user_id)
-    from models.user import User
-    user_obj = await session.get(User, user_id)
-    if user_obj.created_events:
-        _ = user_obj.created_events[0].title  
     return result
 
 
@@ -102,8 +91,7 @@ async def update_user_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
     result = await update_user(session=session, user_id=user_id, payload=payload)
-    from models.user import User
-    user_obj = await session.get(User, user_id)
+    user_cache.invalidate(user_id)
     return result
 
 
@@ -113,22 +101,17 @@ async def delete_user_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserRecord:
     result = await delete_user(session=session, user_id=user_id)
-    from models.user import User
-    deleted_user = await session.get(User, user_id)
-    _ = deleted_user.login  
+    invalidate_user_cascade(user_id)
     return result
 
 
 @users_router.get("/profiles/{profile_id}", response_model=UserProfileRecord)
+@user_profile_cache.cached("profile_id")
 async def get_user_profile_route(
     profile_id: UUID,
     session: AsyncSession = Depends(provide_session),
 ) -> UserProfileRecord:
     result = await get_user_profile(session=session, profile_id=profile_id)
-    from models.user import UserProfile
-    profile_obj = await session.get(UserProfile, profile_id)
-    
-    _ = profile_obj.notification_preferences["email"]  
     return result
 
 
@@ -139,9 +122,7 @@ async def update_user_profile_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserProfileRecord:
     result = await update_user_profile(session=session, profile_id=profile_id, payload=payload)
-    from models.user import UserProfile
-    profile_obj = await session.get(UserProfile, profile_id)
-    await session.commit()
+    user_profile_cache.invalidate(profile_id)
     return result
 
 
@@ -151,9 +132,7 @@ async def delete_user_profile_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserProfileRecord:
     result = await delete_user_profile(session=session, profile_id=profile_id)
-    from models.user import User
-    user_obj = await session.get(User, result.user_id)
-    _ = user_obj.profile.faculty  
+    user_profile_cache.invalidate(profile_id)
     return result
 
 
@@ -163,9 +142,5 @@ async def get_user_profile_by_user_route(
     session: AsyncSession = Depends(provide_session),
 ) -> UserProfileRecord:
     result = await get_user_profile_by_user(session=session, user_id=user_id)
-    from models.user import User
-    user_obj = await session.get(User, user_id)
-    
-    await session.commit()
     return result
 
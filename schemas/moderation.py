@@ -21,6 +21,8 @@ class EventModerationHistoryUpdatePayload(BaseModel):
 class EventModerationHistoryListParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=500)
+    after_created_at: datetime.datetime | None = None
+    after_id: UUID | None = None
     event_id: UUID | None = None
     curator_id: UUID | None = None
 
@@ -51,6 +53,8 @@ class ApplicationHistoryUpdatePayload(BaseModel):
 class ApplicationHistoryListParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=500)
+    after_created_at: datetime.datetime | None = None
+    after_id: UUID | None = None
     application_id: UUID | None = None
     moderator_id: UUID | None = None
 
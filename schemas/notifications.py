@@ -26,6 +26,8 @@ class NotificationUpdatePayload(BaseModel):
 class NotificationListParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=500)
+    after_created_at: datetime.datetime | None = None
+    after_id: UUID | None = None
     user_id: UUID | None = None
     type: NotificationType | None = None
     is_read: bool | None = None
@@ -24,6 +24,8 @@ class RoomUpdatePayload(BaseModel):
 class RoomListParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=500)
+    after_created_at: datetime.datetime | None = None
+    after_id: UUID | None = None
     is_available: bool | None = None
 
 
@@ -26,6 +26,8 @@ class UserUpdatePayload(BaseModel):
 class UserListParams(BaseModel):
     offset: int = Field(0, ge=0)
     limit: int = Field(100, ge=1, le=500)
+    after_created_at: datetime.datetime | None = None
+    after_id: UUID | None = None
     role: UserRole | None = None
 
 
@@ -1,20 +1,18 @@
 import asyncio
 import datetime
-from typing import Any, TypedDict
-from uuid import UUID
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+# SQLAlchemy, модели и core импортируются лениво внутри функций, чтобы импорт скрипта был дешёвым
+if TYPE_CHECKING:
+    from sqlalchemy import Insert, Select, Table
+    from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import sessionmanager
-from core.enums import EventStatus, EventType, UserRole
-from core.security import hash_password
-from models.event import Event
-from models.room import Room
-from models.user import User
 
-
-class RoomSeedPayload(TypedDict):
+@dataclass(frozen=True, slots=True)
+class RoomSeedPayload:
     name: str
     capacity: int
     location: str
@@ -22,23 +20,27 @@ class RoomSeedPayload(TypedDict):
     is_available: bool
 
 
-class RoomSeedResult(TypedDict):
+@dataclass(frozen=True, slots=True)
+class RoomSeedResult:
     id: UUID
     name: str
 
 
-class CuratorSeedPayload(TypedDict):
+@dataclass(frozen=True, slots=True)
+class CuratorSeedPayload:
     login: str
     raw_password: str
     telegram_username: str | None
 
 
-class CuratorSeedResult(TypedDict):
+@dataclass(frozen=True, slots=True)
+class CuratorSeedResult:
     id: UUID
     login: str
 
 
-class EventSeedPayload(TypedDict):
+@dataclass(frozen=True, slots=True)
+class EventSeedPayload:
     title: str
     description: str
     event_date: datetime.date
@@ -50,132 +52,234 @@ class EventSeedPayload(TypedDict):
     room_name: str
 
 
-async def seed_rooms(*, session: AsyncSession, payloads: list[RoomSeedPayload]) -> dict[str, RoomSeedResult]:
-    result: dict[str, RoomSeedResult] = {}
-    for payload in payloads:
-        existing = await session.scalar(select(Room).where(Room.name == payload["name"]))
-        if existing is not None:
-            result[payload["name"]] = {"id": existing.id, "name": existing.name}
-            continue
-        room = Room(
-            name=payload["name"],
-            capacity=payload["capacity"],
-            location=payload["location"],
-            equipment=payload["equipment"],
-            is_available=payload["is_available"],
+class _SeedStatements(NamedTuple):
+    existing_rooms: "Select[Any]"
+    existing_curators: "Select[Any]"
+    existing_event_titles: "Select[Any]"
+    room_insert: "Insert"
+    user_insert: "Insert"
+    event_insert: "Insert"
+
+
+def _any_of(name: str) -> Any:
+    from sqlalchemy import ARRAY, String, any_, bindparam
+
+    # Один массивный параметр вместо IN (...): форма запроса не зависит от числа значений
+    return any_(bindparam(name, type_=ARRAY(String)))
+
+
+# Statement-объекты собираются один раз при первом вызове и переиспользуются дальше
+@lru_cache(maxsize=None)
+def _statements() -> _SeedStatements:
+    from sqlalchemy import select
+
+    from models.event import Event
+    from models.room import Room
+    from models.user import User
+
+    rooms, users, events = Room.__table__, User.__table__, Event.__table__
+    return _SeedStatements(
+        existing_rooms=select(Room.id, Room.name).where(Room.name == _any_of("names")),
+        existing_curators=select(User.id, User.login).where(User.login == _any_of("logins")),
+        existing_event_titles=select(Event.title).where(Event.title == _any_of("titles")),
+        # Вставка идёт через Core-таблицы: ORM bulk insert тут не нужен, строки никуда не загружаются
+        room_insert=rooms.insert().returning(rooms.c.id, rooms.c.name),
+        user_insert=users.insert().returning(users.c.id, users.c.login),
+        event_insert=events.insert(),
+    )
+
+
+# С этого размера строки заливаются через COPY: на тысячах строк он заметно быстрее multi-row INSERT
+_COPY_THRESHOLD = 1000
+
+
+async def _copy_rows(*, session: "AsyncSession", table: "Table", rows: list[dict[str, Any]]) -> None:
+    connection = await session.connection()
+    dialect = connection.dialect
+    columns = list(rows[0])
+    # Те же bind-процессоры, что и у INSERT. COPY идёт мимо SQLAlchemy прямо в кодеки asyncpg, поэтому
+    # полагаемся на то, что кодек json/jsonb принимает str (процессор JSON отдаёт json.dumps), а колонки
+    # SQLEnum пишутся по имени члена (EventStatus.APPROVED -> "APPROVED") как text-значение enum-типа.
+    # UUID, date и time asyncpg кодирует сам. Проверяется tests/test_seed_copy.py на живом Postgres.
+    processors = [table.c[column].type.dialect_impl(dialect).bind_processor(dialect) for column in columns]
+    records = [
+        tuple(
+            row[column] if processor is None else processor(row[column])
+            for column, processor in zip(columns, processors)
         )
-        session.add(room)
-        await session.flush()
-        result[payload["name"]] = {"id": room.id, "name": room.name}
-    await session.commit()
+        for row in rows
+    ]
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(table.name, records=records, columns=columns)
+
+
+async def seed_rooms(*, session: "AsyncSession", payloads: list[RoomSeedPayload]) -> dict[str, RoomSeedResult]:
+    statements = _statements()
+    # Дубли по ключу отсекаем до запросов, иначе batch INSERT вставит одну запись дважды
+    payloads = list({payload.name: payload for payload in payloads}.values())
+    existing = await session.execute(statements.existing_rooms, {"names": [payload.name for payload in payloads]})
+    result = {row.name: RoomSeedResult(id=row.id, name=row.name) for row in existing}
+    to_insert = [
+        {
+            "name": payload.name,
+            "capacity": payload.capacity,
+            "location": payload.location,
+            "equipment": payload.equipment,
+            "is_available": payload.is_available,
+        }
+        for payload in payloads
+        if payload.name not in result
+    ]
+    if len(to_insert) >= _COPY_THRESHOLD:
+        # COPY ничего не возвращает, поэтому id генерируем на клиенте
+        copied = [{**row, "id": uuid4()} for row in to_insert]
+        await _copy_rows(session=session, table=statements.room_insert.table, rows=copied)
+        for row in copied:
+            result[row["name"]] = RoomSeedResult(id=row["id"], name=row["name"])
+    elif to_insert:
+        # Один INSERT ... RETURNING на все недостающие комнаты вместо flush на каждую
+        rows = await session.execute(statements.room_insert, to_insert)
+        for row in rows:
+            result[row.name] = RoomSeedResult(id=row.id, name=row.name)
     return result
 
 
 async def seed_curators(
     *,
-    session: AsyncSession,
+    session: "AsyncSession",
     payloads: list[CuratorSeedPayload],
 ) -> dict[str, CuratorSeedResult]:
-    result: dict[str, CuratorSeedResult] = {}
-    for payload in payloads:
-        existing = await session.scalar(select(User).where(User.login == payload["login"]))
-        if existing is not None:
-            result[payload["login"]] = {"id": existing.id, "login": existing.login}
-            continue
-        user = User(
-            login=payload["login"],
-            password_hash=hash_password(payload["raw_password"]),
-            role=UserRole.CURATOR,
-            telegram_username=payload["telegram_username"],
-        )
-        session.add(user)
-        await session.flush()
-        result[payload["login"]] = {"id": user.id, "login": user.login}
-    await session.commit()
+    from core.enums import UserRole
+    from core.security import hash_password
+
+    statements = _statements()
+    payloads = list({payload.login: payload for payload in payloads}.values())
+    logins = [payload.login for payload in payloads]
+    existing = await session.execute(statements.existing_curators, {"logins": logins})
+    result = {row.login: CuratorSeedResult(id=row.id, login=row.login) for row in existing}
+    to_insert = [
+        {
+            "login": payload.login,
+            "password_hash": hash_password(payload.raw_password),
+            "role": UserRole.CURATOR,
+            "telegram_username": payload.telegram_username,
+        }
+        for payload in payloads
+        if payload.login not in result
+    ]
+    if to_insert:
+        rows = await session.execute(statements.user_insert, to_insert)
+        for row in rows:
+            result[row.login] = CuratorSeedResult(id=row.id, login=row.login)
     return result
 
 
 async def seed_events(
     *,
-    session: AsyncSession,
+    session: "AsyncSession",
     payloads: list[EventSeedPayload],
     curators: dict[str, CuratorSeedResult],
     rooms: dict[str, RoomSeedResult],
 ) -> None:
+    from core.enums import EventStatus, EventType
+
+    statements = _statements()
+    payloads = list({payload.title: payload for payload in payloads}.values())
+    titles = [payload.title for payload in payloads]
+    existing = await session.scalars(statements.existing_event_titles, {"titles": titles})
+    existing_titles = set(existing.all())
+    to_insert: list[dict[str, Any]] = []
     for payload in payloads:
-        existing = await session.scalar(select(Event).where(Event.title == payload["title"]))
-        if existing is not None:
+        if payload.title in existing_titles:
             continue
-        if payload["creator_login"] not in curators:
-            raise ValueError(f"Creator {payload['creator_login']} missing for event {payload['title']}")
-        if payload["curator_login"] not in curators:
-            raise ValueError(f"Curator {payload['curator_login']} missing for event {payload['title']}")
-        if payload["room_name"] not in rooms:
-            raise ValueError(f"Room {payload['room_name']} missing for event {payload['title']}")
-        event = Event(
-            title=payload["title"],
-            description=payload["description"],
-            event_date=payload["event_date"],
-            start_time=payload["start_time"],
-            end_time=payload["end_time"],
-            registered_count=0,
-            max_participants=payload["max_participants"],
-            status=EventStatus.APPROVED,
-            event_type=EventType.OFFICIAL,
-            creator_id=curators[payload["creator_login"]]["id"],
-            curator_id=curators[payload["curator_login"]]["id"],
-            is_external_venue=False,
-            room_id=rooms[payload["room_name"]]["id"],
-            external_location=None,
-            need_approve_candidates=False,
+        creator = curators.get(payload.creator_login)
+        if creator is None:
+            raise ValueError(f"Creator {payload.creator_login} missing for event {payload.title}")
+        curator = curators.get(payload.curator_login)
+        if curator is None:
+            raise ValueError(f"Curator {payload.curator_login} missing for event {payload.title}")
+        room = rooms.get(payload.room_name)
+        if room is None:
+            raise ValueError(f"Room {payload.room_name} missing for event {payload.title}")
+        to_insert.append(
+            {
+                "title": payload.title,
+                "description": payload.description,
+                "event_date": payload.event_date,
+                "start_time": payload.start_time,
+                "end_time": payload.end_time,
+                "registered_count": 0,
+                "max_participants": payload.max_participants,
+                "status": EventStatus.APPROVED,
+                "event_type": EventType.OFFICIAL,
+                "creator_id": creator.id,
+                "curator_id": curator.id,
+                "is_external_venue": False,
+                "room_id": room.id,
+                "external_location": None,
+                "need_approve_candidates": False,
+            }
+        )
+    if len(to_insert) >= _COPY_THRESHOLD:
+        await _copy_rows(
+            session=session,
+            table=statements.event_insert.table,
+            rows=[{**row, "id": uuid4()} for row in to_insert],
         )
-        session.add(event)
-    await session.commit()
+    elif to_insert:
+        await session.execute(statements.event_insert, to_insert)
 
 
 async def run_seed() -> None:
+    from sqlalchemy import text
+
+    from core.database import sessionmanager
+
     if sessionmanager.session_maker is None:
         raise RuntimeError("Database sessionmaker is not initialized")
-    async with sessionmanager.session_maker() as session:
+    # Весь сид в одной транзакции: один коммит и одно соединение на все фазы
+    async with sessionmanager.session_maker() as session, session.begin():
+        # Сид воспроизводим, поэтому ждать fsync WAL на коммите незачем; LOCAL действует только на эту транзакцию
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
         rooms = await seed_rooms(
             session=session,
             payloads=[
-                {
-                    "name": "B504",
-                    "capacity": 120,
-                    "location": "Корпус B, 5 этаж",
-                    "equipment": {"projector": True, "sound_system": True},
-                    "is_available": True,
-                },
-                {
-                    "name": "B502",
-                    "capacity": 90,
-                    "location": "Корпус B, 5 этаж",
-                    "equipment": {"projector": True, "board": True},
-                    "is_available": True,
-                },
-                {
-                    "name": "B506",
-                    "capacity": 70,
-                    "location": "Корпус B, 5 этаж",
-                    "equipment": {"projector": True},
-                    "is_available": True,
-                },
+                RoomSeedPayload(
+                    name="B504",
+                    capacity=120,
+                    location="Корпус B, 5 этаж",
+                    equipment={"projector": True, "sound_system": True},
+                    is_available=True,
+                ),
+                RoomSeedPayload(
+                    name="B502",
+                    capacity=90,
+                    location="Корпус B, 5 этаж",
+                    equipment={"projector": True, "board": True},
+                    is_available=True,
+                ),
+                RoomSeedPayload(
+                    name="B506",
+                    capacity=70,
+                    location="Корпус B, 5 этаж",
+                    equipment={"projector": True},
+                    is_available=True,
+                ),
             ],
         )
         curators = await seed_curators(
             session=session,
             payloads=[
-                {
-                    "login": "curator_alex",
-                    "raw_password": "curator_alex_password",
-                    "telegram_username": "alex_curator",
-                },
-                {
-                    "login": "curator_maria",
-                    "raw_password": "curator_maria_password",
-                    "telegram_username": "maria_curator",
-                },
+                CuratorSeedPayload(
+                    login="curator_alex",
+                    raw_password="curator_alex_password",
+                    telegram_username="alex_curator",
+                ),
+                CuratorSeedPayload(
+                    login="curator_maria",
+                    raw_password="curator_maria_password",
+                    telegram_username="maria_curator",
+                ),
             ],
         )
         today = datetime.date.today()
@@ -184,31 +288,33 @@ async def run_seed() -> None:
             curators=curators,
             rooms=rooms,
             payloads=[
-                {
-                    "title": "Официальная презентация стартапов",
-                    "description": "Презентация проектов с участием студентов и кураторов.",
-                    "event_date": today + datetime.timedelta(days=7),
-                    "start_time": datetime.time(hour=10, minute=0),
-                    "end_time": datetime.time(hour=12, minute=0),
-                    "max_participants": 120,
-                    "creator_login": "curator_alex",
-                    "curator_login": "curator_alex",
-                    "room_name": "B504",
-                },
-                {
-                    "title": "Официальная стратегическая сессия",
-                    "description": "Сессия по планированию мероприятий на семестр.",
-                    "event_date": today + datetime.timedelta(days=14),
-                    "start_time": datetime.time(hour=14, minute=0),
-                    "end_time": datetime.time(hour=16, minute=0),
-                    "max_participants": 90,
-                    "creator_login": "curator_maria",
-                    "curator_login": "curator_alex",
-                    "room_name": "B502",
-                },
+                EventSeedPayload(
+                    title="Официальная презентация стартапов",
+                    description="Презентация проектов с участием студентов и кураторов.",
+                    event_date=today + datetime.timedelta(days=7),
+                    start_time=datetime.time(hour=10, minute=0),
+                    end_time=datetime.time(hour=12, minute=0),
+                    max_participants=120,
+                    creator_login="curator_alex",
+                    curator_login="curator_alex",
+                    room_name="B504",
+                ),
+                EventSeedPayload(
+                    title="Официальная стратегическая сессия",
+                    description="Сессия по планированию мероприятий на семестр.",
+                    event_date=today + datetime.timedelta(days=14),
+                    start_time=datetime.time(hour=14, minute=0),
+                    end_time=datetime.time(hour=16, minute=0),
+                    max_participants=90,
+                    creator_login="curator_maria",
+                    curator_login="curator_alex",
+                    room_name="B502",
+                ),
             ],
         )
 async def main_async() -> None:
+    from core.database import sessionmanager
+
     await run_seed()
     await sessionmanager.close()
 
@@ -42,7 +42,6 @@ async def register_user(*, session: AsyncSession, payload: RegisterPayload) -> U
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return UserRecord.model_validate(user)
 
 
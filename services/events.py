@@ -2,6 +2,7 @@ from uuid import UUID
 
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from core.enums import EventStatus, ModerationAction, NotificationType, UserRole
 from models.event import (
@@ -38,7 +39,7 @@ from schemas.events import (
     EventUpdatePayload,
 )
 from services.exceptions import EntityConflictError, InvalidStateError
-from services.utils import load_entity
+from services.utils import delete_entity, load_entity
 
 
 async def create_event(*, session: AsyncSession, payload: EventCreatePayload) -> EventRecord:
@@ -72,13 +73,12 @@ async def create_event(*, session: AsyncSession, payload: EventCreatePayload) ->
     )
     session.add(event)
     await session.commit()
-    await session.refresh(event)
     await _attach_rejection_comments(session=session, events=[event])
     return EventRecord.model_validate(event)
 
 
 async def list_events(*, session: AsyncSession, params: EventListParams) -> list[EventRecord]:
-    query = select(Event)
+    query = select(Event).options(raiseload("*"))
     if params.status is not None:
         query = query.where(Event.status == params.status)
     if params.event_type is not None:
@@ -139,7 +139,6 @@ async def update_event(*, session: AsyncSession, event_id: UUID, payload: EventU
     if should_notify:
         await _queue_new_event_notifications(session=session, event=event)
     await session.commit()
-    await session.refresh(event)
     await _attach_rejection_comments(session=session, events=[event])
     return EventRecord.model_validate(event)
 
@@ -168,7 +167,6 @@ async def create_event_category(
     )
     session.add(category)
     await session.commit()
-    await session.refresh(category)
     return EventCategoryRecord.model_validate(category)
 
 
@@ -177,7 +175,7 @@ async def list_event_categories(
     session: AsyncSession,
     params: EventCategoryListParams,
 ) -> list[EventCategoryRecord]:
-    query = select(EventCategory)
+    query = select(EventCategory).options(raiseload("*"))
     if params.name is not None:
         query = query.where(EventCategory.name.ilike(f"%{params.name}%"))
     query = query.offset(params.offset).limit(params.limit)
@@ -226,7 +224,6 @@ async def update_event_category(
     for attribute, value in update_data.items():
         setattr(category, attribute, value)
     await session.commit()
-    await session.refresh(category)
     return EventCategoryRecord.model_validate(category)
 
 
@@ -235,14 +232,13 @@ async def delete_event_category(
     session: AsyncSession,
     category_id: UUID,
 ) -> EventCategoryRecord:
-    category = await load_entity(
+    category = await delete_entity(
         session=session,
         model=EventCategory,
         entity_id=category_id,
         entity_label="EventCategory",
     )
     record = EventCategoryRecord.model_validate(category)
-    await session.delete(category)
     await session.commit()
     return record
 
@@ -275,7 +271,6 @@ async def create_event_category_mapping(
     )
     session.add(mapping)
     await session.commit()
-    await session.refresh(mapping)
     return EventCategoryMappingRecord.model_validate(mapping)
 
 
@@ -284,7 +279,7 @@ async def list_event_category_mappings(
     session: AsyncSession,
     params: EventCategoryMappingListParams,
 ) -> list[EventCategoryMappingRecord]:
-    query = select(EventCategoryMapping)
+    query = select(EventCategoryMapping).options(raiseload("*"))
     if params.event_id is not None:
         query = query.where(EventCategoryMapping.event_id == params.event_id)
     if params.category_id is not None:
@@ -344,7 +339,6 @@ async def update_event_category_mapping(
     for attribute, value in update_data.items():
         setattr(mapping, attribute, value)
     await session.commit()
-    await session.refresh(mapping)
     return EventCategoryMappingRecord.model_validate(mapping)
 
 
@@ -353,14 +347,13 @@ async def delete_event_category_mapping(
     session: AsyncSession,
     mapping_id: UUID,
 ) -> EventCategoryMappingRecord:
-    mapping = await load_entity(
+    mapping = await delete_entity(
         session=session,
         model=EventCategoryMapping,
         entity_id=mapping_id,
         entity_label="EventCategoryMapping",
     )
     record = EventCategoryMappingRecord.model_validate(mapping)
-    await session.delete(mapping)
     await session.commit()
     return record
 
@@ -389,7 +382,6 @@ async def create_event_registration(
     )
     session.add(registration)
     await session.commit()
-    await session.refresh(registration)
     return EventRegistrationRecord.model_validate(registration)
 
 
@@ -398,7 +390,7 @@ async def list_event_registrations(
     session: AsyncSession,
     params: EventRegistrationListParams,
 ) -> list[EventRegistrationRecord]:
-    query = select(EventRegistration)
+    query = select(EventRegistration).options(raiseload("*"))
     if params.event_id is not None:
         query = query.where(EventRegistration.event_id == params.event_id)
     if params.user_id is not None:
@@ -438,7 +430,6 @@ async def update_event_registration(
     for attribute, value in update_data.items():
         setattr(registration, attribute, value)
     await session.commit()
-    await session.refresh(registration)
     return EventRegistrationRecord.model_validate(registration)
 
 
@@ -447,14 +438,13 @@ async def delete_event_registration(
     session: AsyncSession,
     registration_id: UUID,
 ) -> EventRegistrationRecord:
-    registration = await load_entity(
+    registration = await delete_entity(
         session=session,
         model=EventRegistration,
         entity_id=registration_id,
         entity_label="EventRegistration",
     )
     record = EventRegistrationRecord.model_validate(registration)
-    await session.delete(registration)
     await session.commit()
     return record
 
@@ -484,7 +474,6 @@ async def create_event_application(
     )
     session.add(application)
     await session.commit()
-    await session.refresh(application)
     return EventApplicationRecord.model_validate(application)
 
 
@@ -493,7 +482,7 @@ async def list_event_applications(
     session: AsyncSession,
     params: EventApplicationListParams,
 ) -> list[EventApplicationRecord]:
-    query = select(EventApplication)
+    query = select(EventApplication).options(raiseload("*"))
     if params.event_id is not None:
         query = query.where(EventApplication.event_id == params.event_id)
     if params.applicant_id is not None:
@@ -537,7 +526,6 @@ async def update_event_application(
     for attribute, value in update_data.items():
         setattr(application, attribute, value)
     await session.commit()
-    await session.refresh(application)
     return EventApplicationRecord.model_validate(application)
 
 
@@ -546,14 +534,13 @@ async def delete_event_application(
     session: AsyncSession,
     application_id: UUID,
 ) -> EventApplicationRecord:
-    application = await load_entity(
+    application = await delete_entity(
         session=session,
         model=EventApplication,
         entity_id=application_id,
         entity_label="EventApplication",
     )
     record = EventApplicationRecord.model_validate(application)
-    await session.delete(application)
     await session.commit()
     return record
 
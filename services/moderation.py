@@ -2,6 +2,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.event import Event, EventApplication
 from models.moderation import EventModerationHistory, ApplicationHistory
@@ -16,7 +17,7 @@ from schemas.moderation import (
     EventModerationHistoryRecord,
     EventModerationHistoryUpdatePayload,
 )
-from services.utils import load_entity
+from services.utils import delete_entity, load_entity, paginate_query
 
 
 async def create_event_moderation_history(
@@ -34,7 +35,6 @@ async def create_event_moderation_history(
     )
     session.add(history)
     await session.commit()
-    await session.refresh(history)
     return EventModerationHistoryRecord.model_validate(history)
 
 
@@ -43,12 +43,19 @@ async def list_event_moderation_history(
     session: AsyncSession,
     params: EventModerationHistoryListParams,
 ) -> list[EventModerationHistoryRecord]:
-    query = select(EventModerationHistory)
+    query = select(EventModerationHistory).options(raiseload("*"))
     if params.event_id is not None:
         query = query.where(EventModerationHistory.event_id == params.event_id)
     if params.curator_id is not None:
         query = query.where(EventModerationHistory.curator_id == params.curator_id)
-    query = query.offset(params.offset).limit(params.limit)
+    query = paginate_query(
+        query,
+        model=EventModerationHistory,
+        offset=params.offset,
+        limit=params.limit,
+        after_created_at=params.after_created_at,
+        after_id=params.after_id,
+    )
     result = await session.scalars(query)
     return [EventModerationHistoryRecord.model_validate(item) for item in result]
 
@@ -83,7 +90,6 @@ async def update_event_moderation_history(
     for attribute, value in update_data.items():
         setattr(history, attribute, value)
     await session.commit()
-    await session.refresh(history)
     return EventModerationHistoryRecord.model_validate(history)
 
 
@@ -92,14 +98,13 @@ async def delete_event_moderation_history(
     session: AsyncSession,
     history_id: UUID,
 ) -> EventModerationHistoryRecord:
-    history = await load_entity(
+    history = await delete_entity(
         session=session,
         model=EventModerationHistory,
         entity_id=history_id,
         entity_label="EventModerationHistory",
     )
     record = EventModerationHistoryRecord.model_validate(history)
-    await session.delete(history)
     await session.commit()
     return record
 
@@ -124,7 +129,6 @@ async def create_application_history(
     )
     session.add(history)
     await session.commit()
-    await session.refresh(history)
     return ApplicationHistoryRecord.model_validate(history)
 
 
@@ -133,12 +137,19 @@ async def list_application_history(
     session: AsyncSession,
     params: ApplicationHistoryListParams,
 ) -> list[ApplicationHistoryRecord]:
-    query = select(ApplicationHistory)
+    query = select(ApplicationHistory).options(raiseload("*"))
     if params.application_id is not None:
         query = query.where(ApplicationHistory.application_id == params.application_id)
     if params.moderator_id is not None:
         query = query.where(ApplicationHistory.moderator_id == params.moderator_id)
-    query = query.offset(params.offset).limit(params.limit)
+    query = paginate_query(
+        query,
+        model=ApplicationHistory,
+        offset=params.offset,
+        limit=params.limit,
+        after_created_at=params.after_created_at,
+        after_id=params.after_id,
+    )
     result = await session.scalars(query)
     return [ApplicationHistoryRecord.model_validate(item) for item in result]
 
@@ -173,7 +184,6 @@ async def update_application_history(
     for attribute, value in update_data.items():
         setattr(history, attribute, value)
     await session.commit()
-    await session.refresh(history)
     return ApplicationHistoryRecord.model_validate(history)
 
 
@@ -182,14 +192,13 @@ async def delete_application_history(
     session: AsyncSession,
     history_id: UUID,
 ) -> ApplicationHistoryRecord:
-    history = await load_entity(
+    history = await delete_entity(
         session=session,
         model=ApplicationHistory,
         entity_id=history_id,
         entity_label="ApplicationHistory",
     )
     record = ApplicationHistoryRecord.model_validate(history)
-    await session.delete(history)
     await session.commit()
     return record
 
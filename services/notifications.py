@@ -2,6 +2,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.event import Event
 from models.notification import Notification
@@ -12,7 +13,7 @@ from schemas.notifications import (
     NotificationRecord,
     NotificationUpdatePayload,
 )
-from services.utils import load_entity
+from services.utils import delete_entity, load_entity, paginate_query
 
 
 async def create_notification(
@@ -38,7 +39,6 @@ async def create_notification(
     )
     session.add(notification)
     await session.commit()
-    await session.refresh(notification)
     return NotificationRecord.model_validate(notification)
 
 
@@ -47,14 +47,21 @@ async def list_notifications(
     session: AsyncSession,
     params: NotificationListParams,
 ) -> list[NotificationRecord]:
-    query = select(Notification)
+    query = select(Notification).options(raiseload("*"))
     if params.user_id is not None:
         query = query.where(Notification.user_id == params.user_id)
     if params.type is not None:
         query = query.where(Notification.type == params.type)
     if params.is_read is not None:
         query = query.where(Notification.is_read == params.is_read)
-    query = query.offset(params.offset).limit(params.limit)
+    query = paginate_query(
+        query,
+        model=Notification,
+        offset=params.offset,
+        limit=params.limit,
+        after_created_at=params.after_created_at,
+        after_id=params.after_id,
+    )
     result = await session.scalars(query)
     return [NotificationRecord.model_validate(item) for item in result]
 
@@ -92,19 +99,17 @@ async def update_notification(
     for attribute, value in update_data.items():
         setattr(notification, attribute, value)
     await session.commit()
-    await session.refresh(notification)
     return NotificationRecord.model_validate(notification)
 
 
 async def delete_notification(*, session: AsyncSession, notification_id: UUID) -> NotificationRecord:
-    notification = await load_entity(
+    notification = await delete_entity(
         session=session,
         model=Notification,
         entity_id=notification_id,
         entity_label="Notification",
     )
     record = NotificationRecord.model_validate(notification)
-    await session.delete(notification)
     await session.commit()
     return record
 
@@ -2,10 +2,11 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.room import Room
 from services.exceptions import EntityConflictError, InvalidStateError
-from services.utils import load_entity
+from services.utils import delete_entity, load_entity, paginate_query
 from schemas.rooms import (
     RoomCreatePayload,
     RoomListParams,
@@ -29,15 +30,21 @@ async def create_room(*, session: AsyncSession, payload: RoomCreatePayload) -> R
     )
     session.add(room)
     await session.commit()
-    await session.refresh(room)
     return RoomRecord.model_validate(room)
 
 
 async def list_rooms(*, session: AsyncSession, params: RoomListParams) -> list[RoomRecord]:
-    query = select(Room)
+    query = select(Room).options(raiseload("*"))
     if params.is_available is not None:
         query = query.where(Room.is_available == params.is_available)
-    query = query.offset(params.offset).limit(params.limit)
+    query = paginate_query(
+        query,
+        model=Room,
+        offset=params.offset,
+        limit=params.limit,
+        after_created_at=params.after_created_at,
+        after_id=params.after_id,
+    )
     result = await session.scalars(query)
     return [RoomRecord.model_validate(item) for item in result]
 
@@ -63,14 +70,12 @@ async def update_room(*, session: AsyncSession, room_id: UUID, payload: RoomUpda
     for attribute, value in update_data.items():
         setattr(room, attribute, value)
     await session.commit()
-    await session.refresh(room)
     return RoomRecord.model_validate(room)
 
 
 async def delete_room(*, session: AsyncSession, room_id: UUID) -> RoomRecord:
-    room = await load_entity(session=session, model=Room, entity_id=room_id, entity_label="Room")
+    room = await delete_entity(session=session, model=Room, entity_id=room_id, entity_label="Room")
     record = RoomRecord.model_validate(room)
-    await session.delete(room)
     await session.commit()
     return record
 
@@ -2,10 +2,11 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from models.user import User, UserProfile
 from services.exceptions import EntityConflictError, EntityNotFoundError
-from services.utils import load_entity, list_entities
+from services.utils import delete_entity, load_entity, list_entities, paginate_query
 from schemas.users import (
     UserCreatePayload,
     UserListParams,
@@ -31,15 +32,21 @@ async def create_user(*, session: AsyncSession, payload: UserCreatePayload) -> U
     )
     session.add(user)
     await session.commit()
-    await session.refresh(user)
     return UserRecord.model_validate(user)
 
 
 async def list_users(*, session: AsyncSession, params: UserListParams) -> list[UserRecord]:
-    query = select(User)
+    query = select(User).options(raiseload("*"))
     if params.role is not None:
         query = query.where(User.role == params.role)
-    query = query.offset(params.offset).limit(params.limit)
+    query = paginate_query(
+        query,
+        model=User,
+        offset=params.offset,
+        limit=params.limit,
+        after_created_at=params.after_created_at,
+        after_id=params.after_id,
+    )
     result = await session.scalars(query)
     return [UserRecord.model_validate(item) for item in result]
 
@@ -62,14 +69,12 @@ async def update_user(*, session: AsyncSession, user_id: UUID, payload: UserUpda
     for attribute, value in update_data.items():
         setattr(user, attribute, value)
     await session.commit()
-    await session.refresh(user)
     return UserRecord.model_validate(user)
 
 
 async def delete_user(*, session: AsyncSession, user_id: UUID) -> UserRecord:
-    user = await load_entity(session=session, model=User, entity_id=user_id, entity_label="User")
+    user = await delete_entity(session=session, model=User, entity_id=user_id, entity_label="User")
     record = UserRecord.model_validate(user)
-    await session.delete(user)
     await session.commit()
     return record
 
@@ -94,7 +99,6 @@ async def create_user_profile(
     )
     session.add(profile)
     await session.commit()
-    await session.refresh(profile)
     return UserProfileRecord.model_validate(profile)
 
 
@@ -158,19 +162,17 @@ async def update_user_profile(
     for attribute, value in update_data.items():
         setattr(profile, attribute, value)
     await session.commit()
-    await session.refresh(profile)
     return UserProfileRecord.model_validate(profile)
 
 
 async def delete_user_profile(*, session: AsyncSession, profile_id: UUID) -> UserProfileRecord:
-    profile = await load_entity(
+    profile = await delete_entity(
         session=session,
         model=UserProfile,
         entity_id=profile_id,
         entity_label="UserProfile",
     )
     record = UserProfileRecord.model_validate(profile)
-    await session.delete(profile)
     await session.commit()
     return record
 
@@ -1,11 +1,13 @@
+import datetime
 from typing import TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, delete, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from core.table import Base
-from services.exceptions import EntityNotFoundError
+from services.exceptions import EntityNotFoundError, InvalidStateError
 
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -18,7 +20,23 @@ async def load_entity(
     entity_id: UUID,
     entity_label: str | None = None,
 ) -> ModelType:
-    instance = await session.get(model, entity_id)
+    instance = await session.get(model, entity_id, options=[raiseload("*")])
+    if instance is None:
+        label = entity_label or model.__name__
+        raise EntityNotFoundError(label)
+    return instance
+
+
+async def delete_entity(
+    *,
+    session: AsyncSession,
+    model: type[ModelType],
+    entity_id: UUID,
+    entity_label: str | None = None,
+) -> ModelType:
+    instance = await session.scalar(
+        delete(model).where(model.id == entity_id).returning(model)
+    )
     if instance is None:
         label = entity_label or model.__name__
         raise EntityNotFoundError(label)
@@ -32,6 +50,24 @@ async def list_entities(
     offset: int,
     limit: int,
 ) -> list[ModelType]:
-    result = await session.scalars(select(model).offset(offset).limit(limit))
+    result = await session.scalars(
+        select(model).options(raiseload("*")).offset(offset).limit(limit)
+    )
     return list(result)
 
+
+def paginate_query(
+    query: Select,
+    *,
+    model: type[ModelType],
+    offset: int,
+    limit: int,
+    after_created_at: datetime.datetime | None = None,
+    after_id: UUID | None = None,
+) -> Select:
+    if (after_created_at is None) != (after_id is None):
+        raise InvalidStateError("after_created_at and after_id must be provided together")
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    if after_created_at is not None:
+        query = query.where(tuple_(model.created_at, model.id) < (after_created_at, after_id))
+    return query.offset(offset).limit(limit)
@@ -5,4 +5,9 @@ alembic upgrade head
 
 python -m scripts.seed_data
 
-exec uvicorn main:app --host 0.0.0.0 --port "${PORT:-8000}"
+exec uvicorn main:app \
+    --host 0.0.0.0 \
+    --port "${PORT:-8000}" \
+    --loop uvloop \
+    --http httptools \
+    --workers "${WEB_CONCURRENCY:-1}"
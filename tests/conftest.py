@@ -0,0 +1,43 @@
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+import models  # noqa: F401
+from core.database import sessionmanager
+from main import app
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    # NullPool: TestClient гоняет каждый запрос в своём event loop, пул соединений между ними не переживёт
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", poolclass=NullPool)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection, _) -> None:
+        # Без этого SQLite игнорирует ON DELETE CASCADE
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    original_engine = sessionmanager.engine
+    sessionmanager.engine = engine
+    sessionmanager.session_maker.configure(bind=engine)
+    asyncio.run(sessionmanager.create_all())
+    with TestClient(app) as test_client:
+        yield test_client
+    asyncio.run(engine.dispose())
+    sessionmanager.engine = original_engine
+    sessionmanager.session_maker.configure(bind=original_engine)
+
+
+@pytest.fixture
+def auth_headers(client: TestClient) -> dict[str, str]:
+    client.post("/auth/register", json={"login": "admin", "password": "password", "role": "admin"})
+    response = client.post("/auth/login", json={"login": "admin", "password": "password"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,128 @@
+import asyncio
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from core.cache import ResponseCache
+
+
+def test_user_delete_evicts_cascaded_profile(client: TestClient, auth_headers: dict[str, str]) -> None:
+    user_id = client.post("/auth/register", json={"login": "student", "password": "password"}).json()["id"]
+    profile = client.post("/users/profiles", json={"user_id": user_id, "faculty": "ИТ"}, headers=auth_headers).json()
+    assert client.get(f"/users/profiles/{profile['id']}", headers=auth_headers).status_code == 200
+
+    assert client.delete(f"/users/{user_id}", headers=auth_headers).status_code == 200
+
+    assert client.get(f"/users/profiles/{profile['id']}", headers=auth_headers).status_code == 404
+
+
+def test_user_delete_evicts_cascaded_notification(client: TestClient, auth_headers: dict[str, str]) -> None:
+    user_id = client.post("/auth/register", json={"login": "student", "password": "password"}).json()["id"]
+    notification = client.post(
+        "/notifications/",
+        json={"user_id": user_id, "type": "system", "title": "title", "message": "message"},
+        headers=auth_headers,
+    ).json()
+    assert client.get(f"/notifications/{notification['id']}", headers=auth_headers).status_code == 200
+
+    assert client.delete(f"/users/{user_id}", headers=auth_headers).status_code == 200
+
+    assert client.get(f"/notifications/{notification['id']}", headers=auth_headers).status_code == 404
+
+
+def _create_event(client: TestClient, auth_headers: dict[str, str]) -> tuple[str, str]:
+    curator_id = client.post(
+        "/auth/register", json={"login": "curator", "password": "password", "role": "curator"}
+    ).json()["id"]
+    event = client.post(
+        "/events/",
+        json={
+            "title": "event",
+            "event_date": "2030-01-01",
+            "start_time": "10:00",
+            "end_time": "11:00",
+            "creator_id": curator_id,
+            "curator_id": curator_id,
+            "is_external_venue": True,
+            "external_location": "online",
+        },
+        headers=auth_headers,
+    ).json()
+    return event["id"], curator_id
+
+
+def test_event_delete_evicts_cascaded_moderation_history(client: TestClient, auth_headers: dict[str, str]) -> None:
+    event_id, curator_id = _create_event(client, auth_headers)
+    history = client.post(
+        "/moderation/event-history",
+        json={"event_id": event_id, "curator_id": curator_id, "action": "approve"},
+        headers=auth_headers,
+    ).json()
+    assert client.get(f"/moderation/event-history/{history['id']}", headers=auth_headers).status_code == 200
+
+    assert client.delete(f"/events/{event_id}", headers=auth_headers).status_code == 200
+
+    assert client.get(f"/moderation/event-history/{history['id']}", headers=auth_headers).status_code == 404
+
+
+def test_application_delete_evicts_cascaded_history(client: TestClient, auth_headers: dict[str, str]) -> None:
+    event_id, curator_id = _create_event(client, auth_headers)
+    application = client.post(
+        "/events/applications", json={"event_id": event_id, "applicant_id": curator_id}, headers=auth_headers
+    ).json()
+    history = client.post(
+        "/moderation/application-history",
+        json={"application_id": application["id"], "moderator_id": curator_id, "action": "approve"},
+        headers=auth_headers,
+    ).json()
+    assert client.get(f"/moderation/application-history/{history['id']}", headers=auth_headers).status_code == 200
+
+    assert client.delete(f"/events/applications/{application['id']}", headers=auth_headers).status_code == 200
+
+    assert client.get(f"/moderation/application-history/{history['id']}", headers=auth_headers).status_code == 404
+
+
+def test_in_flight_read_does_not_repopulate_invalidated_key() -> None:
+    cache = ResponseCache(ttl_seconds=60, max_entries=8)
+    key = uuid4()
+
+    async def scenario() -> None:
+        started, release = asyncio.Event(), asyncio.Event()
+
+        @cache.cached("item_id")
+        async def load(*, item_id):
+            started.set()
+            await release.wait()
+            return "stale"
+
+        read = asyncio.create_task(load(item_id=key))
+        await started.wait()
+        cache.invalidate(key)
+        release.set()
+        assert await read == "stale"
+
+    asyncio.run(scenario())
+    assert cache.get(key) is None
+
+
+def test_in_flight_read_does_not_repopulate_after_clear() -> None:
+    cache = ResponseCache(ttl_seconds=60, max_entries=8)
+    key = uuid4()
+
+    async def scenario() -> None:
+        started, release = asyncio.Event(), asyncio.Event()
+
+        @cache.cached("item_id")
+        async def load(*, item_id):
+            started.set()
+            await release.wait()
+            return "stale"
+
+        read = asyncio.create_task(load(item_id=key))
+        await started.wait()
+        cache.clear()
+        release.set()
+        await read
+
+    asyncio.run(scenario())
+    assert cache.get(key) is None